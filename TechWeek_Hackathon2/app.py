@@ -3,7 +3,6 @@ from fastapi import FastAPI, File, UploadFile, Form, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-import pandas as pd
 import os
 import re
 import google.generativeai as genai
@@ -13,6 +12,8 @@ import json
 from markdown_it import MarkdownIt
 import asyncio
 from career_recommender import recommend_careers
+from job_store import get_store
+from title_index import TitleIndex
 
 app = FastAPI()
 
@@ -29,26 +30,20 @@ else:
     print("ERROR: GEMINI_API_KEY environment variable not found.")
 
 # --- Data Loading ---
-try:
-    job_data = pd.read_csv("datafile/job_applicant_dataset.csv")
-except FileNotFoundError:
-    print("Error: job_applicant_dataset.csv not found.")
-    job_data = pd.DataFrame() # Create an empty dataframe to avoid errors
+# Shared with career_recommender; under serve.py it is loaded once in the master.
+job_store = get_store()
+title_index = TitleIndex(job_store.roles)
 
 def get_job_roles():
     """Gets unique job roles from the dataset."""
-    if not job_data.empty:
-        return job_data["Job Roles"].unique().tolist()
-    return []
+    return job_store.roles
 
 # --- Helper Functions ---
 def get_prompt(job_role):
     """Generates the prompt for the Gemini API."""
-    required_skills_str = "Any"
-    if not job_data.empty and job_role in job_data["Job Roles"].values:
-        skills_series = job_data[job_data["Job Roles"] == job_role]["Resume"]
-        if not skills_series.empty:
-            required_skills_str = skills_series.iloc[0]
+    # Free-text roles ("Sr. Data Analyst") are matched to a dataset role for the skills lookup only.
+    dataset_role = title_index.resolve(job_role)
+    required_skills_str = job_store.role_skills.get(dataset_role) or "Any"
 
     prompt_template = '''
 You are an expert career advisor and resume analyzer. 
@@ -236,8 +231,10 @@ async def career_roadmap_post(request: Request, current_job: str = Form(...)):
 
     try:
         print(f"--- Generating roadmap for: {current_job} ---")
+        # Spelling variants share one canonical role, so they produce the same prompt.
+        canonical_job = title_index.resolve(current_job) or current_job.strip()
         model = genai.GenerativeModel('gemini-2.5-pro')
-        prompt = f"Generate a detailed career roadmap for a '{current_job}'. Provide the output as a single line of text, with each job and duration separated by a '|' character. For example: Junior Software Engineer (0-3 years) | Software Engineer (3-5 years) | Senior Software Engineer (5+ years)"
+        prompt = f"Generate a detailed career roadmap for a '{canonical_job}'. Provide the output as a single line of text, with each job and duration separated by a '|' character. For example: Junior Software Engineer (0-3 years) | Software Engineer (3-5 years) | Senior Software Engineer (5+ years)"
         print(f"Prompt: {prompt}")
         response = await model.generate_content_async(prompt)
         roadmap_text = response.text
@@ -1,22 +1,13 @@
 # career_recommender.py
 
-import pandas as pd
 import google.generativeai as genai
 import re
 import json
 from typing import List
+from job_store import get_store
 
 # --- Data Loading ---
-try:
-    job_data = pd.read_csv("datafile/job_applicant_dataset.csv")
-    if 'Resume' in job_data.columns:
-        job_data['Resume'] = job_data['Resume'].fillna('')
-    else:
-        print("Warning: 'Resume' column not found in dataset. Pre-filtering will not work.")
-        job_data = pd.DataFrame()
-except FileNotFoundError:
-    print("Warning: datafile/job_applicant_dataset.csv not found. Recommender is disabled.")
-    job_data = pd.DataFrame()
+job_store = get_store()
 
 async def extract_skills_from_text(resume_text: str) -> List[str]:
     """Uses the AI to quickly extract a list of skills from raw resume text for filtering."""
@@ -34,15 +25,12 @@ async def extract_skills_from_text(resume_text: str) -> List[str]:
 
 def find_top_matching_jobs(user_skills: List[str], top_n: int = 10) -> List[str]:
     """Performs a pre-filtering step to find the most relevant jobs from the CSV."""
-    if job_data.empty or 'Resume' not in job_data.columns or not user_skills:
+    if not job_store.skill_vocab or not user_skills:
         return []
     user_skills_set = {skill.lower() for skill in user_skills}
-    def calculate_match_score(job_skills_str: str) -> int:
-        job_skills = {skill.strip().lower() for skill in job_skills_str.split(',')}
-        return len(user_skills_set.intersection(job_skills))
-    job_data['match_score'] = job_data['Resume'].apply(calculate_match_score)
-    top_jobs = job_data.sort_values(by='match_score', ascending=False).head(top_n)
-    return top_jobs["Job Roles"].tolist()
+    scores = [len(user_skills_set.intersection(job_skills)) for job_skills in job_store.row_skills]
+    top_rows = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:top_n]
+    return [job_store.rows[i][0] for i in top_rows]
 
 def create_recommendation_prompt(resume_text: str, relevant_jobs: List[str]) -> str:
     """Creates the final prompt using the full resume text and a pre-filtered job list."""
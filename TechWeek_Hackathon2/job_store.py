@@ -0,0 +1,59 @@
+# job_store.py
+
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+DATASET_PATH = "datafile/job_applicant_dataset.csv"
+
+
+def _split_skills(skills_str: str) -> FrozenSet[str]:
+    return frozenset(skill.strip().lower() for skill in skills_str.split(','))
+
+
+class JobStore:
+    """Read-only job dataset plus the lookup structures derived from it."""
+
+    def __init__(self, rows: List[Tuple[str, str]]):
+        # rows: one (job_role, resume_skills) pair per dataset row, in CSV order.
+        self.rows = rows
+        self.role_skills: Dict[str, str] = {}
+        for role, skills_str in rows:
+            self.role_skills.setdefault(role, skills_str)
+        self.roles: List[str] = list(self.role_skills)
+        self.row_skills: List[FrozenSet[str]] = [_split_skills(skills_str) for _, skills_str in rows]
+        self.skill_vocab: FrozenSet[str] = frozenset().union(*self.row_skills) - {''}
+
+
+def load_dataset(csv_path: str = DATASET_PATH) -> JobStore:
+    """Parses the job dataset CSV. This is the only place pandas is needed."""
+    import pandas as pd
+
+    try:
+        job_data = pd.read_csv(csv_path)
+    except FileNotFoundError:
+        print(f"Warning: {csv_path} not found. Job dataset features are disabled.")
+        return JobStore([])
+    if "Job Roles" not in job_data.columns:
+        print("Warning: 'Job Roles' column not found in dataset. Job dataset features are disabled.")
+        return JobStore([])
+    if "Resume" in job_data.columns:
+        resumes = job_data["Resume"].fillna('').astype(str)
+    else:
+        # Roles are still listed; the recommender is disabled (empty skill_vocab).
+        print("Warning: 'Resume' column not found in dataset. Pre-filtering will not work.")
+        resumes = [''] * len(job_data)
+    return JobStore(list(zip(job_data["Job Roles"].astype(str), resumes)))
+
+
+_store: Optional[JobStore] = None
+
+
+def get_store() -> JobStore:
+    """Returns the process-wide store, loading it on first use.
+
+    Under serve.py this runs once in the gunicorn master before workers are
+    forked; workers share the loaded store's pages copy-on-write.
+    """
+    global _store
+    if _store is None:
+        _store = load_dataset()
+    return _store
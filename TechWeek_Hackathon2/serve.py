@@ -0,0 +1,88 @@
+# serve.py
+#
+# Production launcher. The app (and with it the job dataset) is imported once
+# in the gunicorn master before forking, so workers inherit the loaded store
+# copy-on-write instead of each importing pandas and re-reading the CSV.
+#
+#   python serve.py                 # pre-fork, dataset loaded once in the master
+#   python serve.py --no-preload    # every worker loads the CSV itself (for comparison)
+#
+# Settings come from the environment: PORT, WEB_CONCURRENCY, TIMEOUT,
+# GRACEFUL_TIMEOUT, MAX_REQUESTS, MAX_REQUESTS_JITTER. Send SIGHUP to the
+# master to gracefully restart all workers.
+
+import argparse
+import gc
+import os
+
+from gunicorn.app.base import BaseApplication
+
+
+def memory_usage_mb() -> dict:
+    """Reads RSS, PSS and USS (private pages) of the current process, in MB. Linux only."""
+    usage = {"rss": 0.0, "pss": 0.0, "uss": 0.0}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if not value.strip().endswith("kB"):
+                    continue
+                kb = int(value.split()[0])
+                if key == "Rss":
+                    usage["rss"] += kb / 1024
+                elif key == "Pss":
+                    usage["pss"] += kb / 1024
+                elif key in ("Private_Clean", "Private_Dirty"):
+                    usage["uss"] += kb / 1024
+    except OSError:
+        pass
+    return usage
+
+
+def log_worker_memory(worker):
+    usage = memory_usage_mb()
+    print(f"[worker {worker.pid}] rss={usage['rss']:.1f}MB pss={usage['pss']:.1f}MB uss={usage['uss']:.1f}MB")
+
+
+class StandaloneApplication(BaseApplication):
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        from app import app
+        # Keep the loaded objects out of the GC's reach so collections in the
+        # workers don't touch (and un-share) the pages inherited from the master.
+        gc.freeze()
+        return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Career Navigator with multiple workers.")
+    parser.add_argument("--no-preload", action="store_true",
+                        help="Don't import the app in the master; each worker loads the dataset on its own.")
+    args = parser.parse_args()
+
+    options = {
+        "bind": f"0.0.0.0:{os.environ.get('PORT', '8000')}",
+        "workers": int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        # Gemini calls can take a while; don't kill workers mid-request.
+        "timeout": int(os.environ.get("TIMEOUT", "120")),
+        "graceful_timeout": int(os.environ.get("GRACEFUL_TIMEOUT", "30")),
+        # Recycle workers periodically; with preload they are re-forked from the
+        # master, so a restart never re-parses the dataset.
+        "max_requests": int(os.environ.get("MAX_REQUESTS", "1000")),
+        "max_requests_jitter": int(os.environ.get("MAX_REQUESTS_JITTER", "100")),
+        "preload_app": not args.no_preload,
+        "post_worker_init": log_worker_memory,
+    }
+    StandaloneApplication(options).run()
+
+
+if __name__ == "__main__":
+    main()
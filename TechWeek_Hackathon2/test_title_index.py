@@ -0,0 +1,80 @@
+# test_title_index.py
+
+import pytest
+
+from title_index import TitleIndex, normalize_title
+
+ROLES = [
+    "Data Analyst",
+    "Data Scientist",
+    "Software Engineer",
+    "Product Manager",
+    "HR Manager",
+    "Machine Learning Engineer",
+    "Project Manager",
+    "Web Developer",
+    "Database Administrator",
+    "Graphic Designer",
+    "Accountant",
+    "UX Designer",
+    "Mechanical Engineer",
+    "Civil Engineer",
+]
+
+
+@pytest.fixture
+def index():
+    return TitleIndex(ROLES)
+
+
+def test_normalize_title_expands_abbreviations():
+    assert normalize_title("Sr. Data Analyst") == "senior data analyst"
+    assert normalize_title("R&D  Mgr") == "r and d manager"
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("Data Analyst", "Data Analyst"),
+    ("data analyst", "Data Analyst"),
+    ("Sr. Data Analyst", "Data Analyst"),
+    ("SWE", "Software Engineer"),
+    ("senior software eng", "Software Engineer"),
+    ("ML engineer", "Machine Learning Engineer"),
+    ("hr mgr", "HR Manager"),
+    ("DBA", "Database Administrator"),
+    ("product mgr", "Product Manager"),
+    ("Junior Web Dev", "Web Developer"),
+    ("accountant ii", "Accountant"),
+])
+def test_resolves_variants_to_dataset_role(index, query, expected):
+    assert index.resolve(query) == expected
+
+
+@pytest.mark.parametrize("query", [
+    "Electrical Engineer",
+    "Chemical Engineer",
+    "Product Designer",
+    "data engineer",
+    "engineer",
+    "Chef",
+])
+def test_rejects_matches_on_generic_suffix_only(index, query):
+    assert index.resolve(query) is None
+
+
+def test_generic_only_title_requires_generic_query():
+    index = TitleIndex(ROLES + ["Engineer"])
+    assert index.resolve("Electrical Engineer") is None
+    assert index.resolve("Chemical Engineer") is None
+    assert index.resolve("Data Engineer") is None
+    assert index.resolve("senior engineer") == "Engineer"
+
+
+@pytest.mark.parametrize("query", ["", "   ", "..."])
+def test_empty_input(index, query):
+    assert index.resolve(query) is None
+
+
+def test_empty_index():
+    index = TitleIndex([])
+    assert index.resolve("Data Analyst") is None
+    assert index.resolve("") is None
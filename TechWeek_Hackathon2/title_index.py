@@ -0,0 +1,122 @@
+# title_index.py
+
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional
+
+import numpy as np
+
+# Expanded token by token after normalization, so "Sr. Data Analyst" and
+# "senior data analyst" produce the same key.
+ABBREVIATIONS = {
+    "sr": "senior",
+    "snr": "senior",
+    "jr": "junior",
+    "jnr": "junior",
+    "asst": "assistant",
+    "assoc": "associate",
+    "mgr": "manager",
+    "mngr": "manager",
+    "dir": "director",
+    "exec": "executive",
+    "admin": "administrator",
+    "coord": "coordinator",
+    "spec": "specialist",
+    "rep": "representative",
+    "eng": "engineer",
+    "engr": "engineer",
+    "dev": "developer",
+    "sw": "software",
+    "swe": "software engineer",
+    "sde": "software development engineer",
+    "dba": "database administrator",
+    "qa": "quality assurance",
+    "hr": "human resources",
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "vp": "vice president",
+}
+
+# Seniority and generic role nouns. Two titles only match if they also share a
+# token outside this set (or neither has one), so "Electrical Engineer" never
+# resolves to "Mechanical Engineer" on the strength of the common suffix.
+GENERIC_TOKENS = frozenset({
+    "senior", "junior", "lead", "principal", "chief", "head", "staff", "intern", "trainee",
+    "entry", "level", "i", "ii", "iii", "iv", "and", "of",
+    "engineer", "developer", "designer", "manager", "analyst", "specialist", "consultant",
+    "administrator", "officer", "coordinator", "executive", "director", "representative",
+    "technician", "associate", "assistant", "scientist", "architect",
+})
+
+
+def normalize_title(text: str) -> str:
+    """Lowercases, strips punctuation and expands common abbreviations."""
+    text = unicodedata.normalize("NFKC", text).lower().replace("&", " and ")
+    tokens = re.sub(r"[^\w]+", " ", text).split()
+    return " ".join(ABBREVIATIONS.get(token, token) for token in tokens)
+
+
+def _char_ngrams(key: str, n: int) -> Counter:
+    padded = f" {key} "
+    return Counter(padded[i:i + n] for i in range(len(padded) - n + 1))
+
+
+def _head_tokens(key: str) -> FrozenSet[str]:
+    return frozenset(key.split()) - GENERIC_TOKENS
+
+
+class TitleIndex:
+    """Resolves free-text job titles to the closest known title by n-gram cosine similarity."""
+
+    def __init__(self, titles: List[str], ngram: int = 3, threshold: float = 0.6, cache_size: int = 4096):
+        self.titles = list(titles)
+        self.ngram = ngram
+        self.threshold = threshold
+        self._exact: Dict[str, str] = {}
+        for title in self.titles:
+            self._exact.setdefault(normalize_title(title), title)
+
+        keys = [normalize_title(title) for title in self.titles]
+        self._heads = [_head_tokens(key) for key in keys]
+        grams = [_char_ngrams(key, ngram) for key in keys]
+        self.vocab: Dict[str, int] = {}
+        for counts in grams:
+            for gram in counts:
+                self.vocab.setdefault(gram, len(self.vocab))
+
+        # One L2-normalised row per title; a query only touches its own columns.
+        self.matrix = np.zeros((len(self.titles), len(self.vocab)), dtype=np.float32)
+        for row, counts in enumerate(grams):
+            for gram, count in counts.items():
+                self.matrix[row, self.vocab[gram]] = count
+        norms = np.linalg.norm(self.matrix, axis=1, keepdims=True)
+        self.matrix /= np.where(norms == 0, 1, norms)
+
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def _resolve(self, text: str) -> Optional[str]:
+        key = normalize_title(text)
+        if not key or not self.titles:
+            return None
+        if key in self._exact:
+            return self._exact[key]
+
+        counts = _char_ngrams(key, self.ngram)
+        columns = [self.vocab[gram] for gram in counts if gram in self.vocab]
+        if not columns:
+            return None
+        weights = np.array([counts[gram] for gram in counts if gram in self.vocab], dtype=np.float32)
+        # Unknown n-grams still count towards the query norm.
+        query_norm = np.sqrt(sum(count * count for count in counts.values()))
+        scores = self.matrix[:, columns] @ weights / query_norm
+
+        heads = _head_tokens(key)
+        candidates = np.flatnonzero(scores >= self.threshold)
+        for row in candidates[np.argsort(-scores[candidates])]:
+            # Titles made only of generic tokens (e.g. "Engineer") only match queries
+            # that are generic too, so "Data Engineer" can't fall back to them.
+            if heads & self._heads[row] or (not heads and not self._heads[row]):
+                return self.titles[row]
+        return None